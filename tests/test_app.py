@@ -2,85 +2,114 @@
 Tests for the High School Management System API
 """
 
+import functools
+
 import pytest
+from fastapi import HTTPException
 from fastapi.testclient import TestClient
-from src.app import app, activities
+from src.app import app, activities, remove_participant, signup_for_activity
+
+# URL builders for the signup and removal endpoints
+_SIGNUP_URL = "/activities/{activity}/signup?email={email}".format
+_REMOVE_URL = "/activities/{activity}/participants/{email}".format
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
+    """Create a test client shared by the whole session"""
+    with TestClient(app) as test_client:
+        yield test_client
 
 
-@pytest.fixture(autouse=True)
-def reset_activities():
-    """Reset activities data before each test"""
-    # Store original state
-    original_activities = {
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        },
-        "Basketball Team": {
-            "description": "Practice basketball skills and compete in interscholastic games",
-            "schedule": "Tuesdays and Thursdays, 4:00 PM - 6:00 PM",
-            "max_participants": 15,
-            "participants": ["james@mergington.edu", "liam@mergington.edu"]
-        },
-        "Track and Field": {
-            "description": "Train for various running, jumping, and throwing events",
-            "schedule": "Mondays and Wednesdays, 3:30 PM - 5:30 PM",
-            "max_participants": 25,
-            "participants": ["ava@mergington.edu", "noah@mergington.edu"]
-        },
-        "Art Club": {
-            "description": "Explore various art mediums including painting, drawing, and sculpture",
-            "schedule": "Wednesdays, 3:00 PM - 5:00 PM",
-            "max_participants": 18,
-            "participants": ["mia@mergington.edu", "charlotte@mergington.edu"]
-        },
-        "Drama Club": {
-            "description": "Develop acting skills and participate in theater productions",
-            "schedule": "Thursdays, 3:30 PM - 6:00 PM",
-            "max_participants": 20,
-            "participants": ["ethan@mergington.edu", "isabella@mergington.edu"]
-        },
-        "Debate Team": {
-            "description": "Develop critical thinking and public speaking through competitive debates",
-            "schedule": "Mondays, 3:30 PM - 5:00 PM",
-            "max_participants": 16,
-            "participants": ["lucas@mergington.edu", "amelia@mergington.edu"]
-        },
-        "Science Olympiad": {
-            "description": "Compete in science competitions and conduct experiments",
-            "schedule": "Tuesdays, 3:30 PM - 5:30 PM",
-            "max_participants": 20,
-            "participants": ["mason@mergington.edu", "harper@mergington.edu"]
-        }
+# Canonical activities state that every test starts from
+_ORIGINAL_ACTIVITIES_SNAPSHOT = {
+    "Chess Club": {
+        "description": "Learn strategies and compete in chess tournaments",
+        "schedule": "Fridays, 3:30 PM - 5:00 PM",
+        "max_participants": 12,
+        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+    },
+    "Programming Class": {
+        "description": "Learn programming fundamentals and build software projects",
+        "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
+        "max_participants": 20,
+        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+    },
+    "Gym Class": {
+        "description": "Physical education and sports activities",
+        "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
+        "max_participants": 30,
+        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+    },
+    "Basketball Team": {
+        "description": "Practice basketball skills and compete in interscholastic games",
+        "schedule": "Tuesdays and Thursdays, 4:00 PM - 6:00 PM",
+        "max_participants": 15,
+        "participants": ["james@mergington.edu", "liam@mergington.edu"]
+    },
+    "Track and Field": {
+        "description": "Train for various running, jumping, and throwing events",
+        "schedule": "Mondays and Wednesdays, 3:30 PM - 5:30 PM",
+        "max_participants": 25,
+        "participants": ["ava@mergington.edu", "noah@mergington.edu"]
+    },
+    "Art Club": {
+        "description": "Explore various art mediums including painting, drawing, and sculpture",
+        "schedule": "Wednesdays, 3:00 PM - 5:00 PM",
+        "max_participants": 18,
+        "participants": ["mia@mergington.edu", "charlotte@mergington.edu"]
+    },
+    "Drama Club": {
+        "description": "Develop acting skills and participate in theater productions",
+        "schedule": "Thursdays, 3:30 PM - 6:00 PM",
+        "max_participants": 20,
+        "participants": ["ethan@mergington.edu", "isabella@mergington.edu"]
+    },
+    "Debate Team": {
+        "description": "Develop critical thinking and public speaking through competitive debates",
+        "schedule": "Mondays, 3:30 PM - 5:00 PM",
+        "max_participants": 16,
+        "participants": ["lucas@mergington.edu", "amelia@mergington.edu"]
+    },
+    "Science Olympiad": {
+        "description": "Compete in science competitions and conduct experiments",
+        "schedule": "Tuesdays, 3:30 PM - 5:30 PM",
+        "max_participants": 20,
+        "participants": ["mason@mergington.edu", "harper@mergington.edu"]
     }
-    
-    # Reset to original state before each test
-    activities.clear()
-    activities.update(original_activities)
-    yield
-    # Reset after test as well
+}
+
+
+@functools.cache
+def _snapshot():
+    """Build the pristine activities once, with immutable participant tuples"""
+    return {
+        name: {**activity, "participants": tuple(activity["participants"])}
+        for name, activity in _ORIGINAL_ACTIVITIES_SNAPSHOT.items()
+    }
+
+
+@pytest.fixture(scope="session")
+def _pristine_activities():
+    """Load the pristine activities into the app once per session
+
+    Under pytest-xdist every worker is its own process with its own copy of
+    the app module, so this runs once per worker and tests stay isolated.
+    """
     activities.clear()
-    activities.update(original_activities)
+    for name, activity in _snapshot().items():
+        activities[name] = {**activity, "participants": list(activity["participants"])}
+    yield activities
+    # Leave the app clean for anything running later in the same process
+    for name, activity in _snapshot().items():
+        activities[name]["participants"][:] = activity["participants"]
+
+
+@pytest.fixture(autouse=True)
+def reset_activities(_pristine_activities):
+    """Reset participant lists before each test"""
+    for name, activity in _snapshot().items():
+        activities[name]["participants"][:] = activity["participants"]
 
 
 class TestRootEndpoint:
@@ -133,33 +162,22 @@ class TestSignupForActivity:
         assert "Chess Club" in data["message"]
         
         # Verify participant was added
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "newstudent@mergington.edu" in activities_data["Chess Club"]["participants"]
+        assert "newstudent@mergington.edu" in activities["Chess Club"]["participants"]
     
-    def test_signup_for_nonexistent_activity(self, client):
+    def test_signup_for_nonexistent_activity(self):
         """Test signup for an activity that doesn't exist"""
-        response = client.post(
-            "/activities/Nonexistent Club/signup?email=student@mergington.edu"
-        )
-        assert response.status_code == 404
-        data = response.json()
-        assert data["detail"] == "Activity not found"
+        with pytest.raises(HTTPException) as exc:
+            signup_for_activity("Nonexistent Club", "student@mergington.edu")
+        assert exc.value.status_code == 404
+        assert exc.value.detail == "Activity not found"
     
-    def test_signup_duplicate_participant(self, client):
+    def test_signup_duplicate_participant(self):
         """Test that duplicate signups are rejected"""
         email = "michael@mergington.edu"  # Already in Chess Club
-        response = client.post(f"/activities/Chess Club/signup?email={email}")
-        assert response.status_code == 400
-        data = response.json()
-        assert data["detail"] == "Student already signed up for this activity"
-    
-    def test_signup_with_url_encoded_activity_name(self, client):
-        """Test signup with URL-encoded activity name"""
-        response = client.post(
-            "/activities/Track%20and%20Field/signup?email=newrunner@mergington.edu"
-        )
-        assert response.status_code == 200
+        with pytest.raises(HTTPException) as exc:
+            signup_for_activity("Chess Club", email)
+        assert exc.value.status_code == 400
+        assert exc.value.detail == "Student already signed up for this activity"
 
 
 class TestRemoveParticipant:
@@ -168,8 +186,7 @@ class TestRemoveParticipant:
     def test_remove_participant_success(self, client):
         """Test successful removal of a participant"""
         # First verify participant exists
-        activities_before = client.get("/activities").json()
-        assert "michael@mergington.edu" in activities_before["Chess Club"]["participants"]
+        assert "michael@mergington.edu" in activities["Chess Club"]["participants"]
         
         # Remove participant
         response = client.delete(
@@ -181,33 +198,34 @@ class TestRemoveParticipant:
         assert "michael@mergington.edu" in data["message"]
         
         # Verify participant was removed
-        activities_after = client.get("/activities").json()
-        assert "michael@mergington.edu" not in activities_after["Chess Club"]["participants"]
+        assert "michael@mergington.edu" not in activities["Chess Club"]["participants"]
     
-    def test_remove_participant_from_nonexistent_activity(self, client):
+    def test_remove_participant_from_nonexistent_activity(self):
         """Test removing participant from an activity that doesn't exist"""
-        response = client.delete(
-            "/activities/Nonexistent Club/participants/student@mergington.edu"
-        )
-        assert response.status_code == 404
-        data = response.json()
-        assert data["detail"] == "Activity not found"
+        with pytest.raises(HTTPException) as exc:
+            remove_participant("Nonexistent Club", "student@mergington.edu")
+        assert exc.value.status_code == 404
+        assert exc.value.detail == "Activity not found"
     
-    def test_remove_nonexistent_participant(self, client):
+    def test_remove_nonexistent_participant(self):
         """Test removing a participant that isn't signed up"""
-        response = client.delete(
-            "/activities/Chess Club/participants/notregistered@mergington.edu"
-        )
-        assert response.status_code == 404
-        data = response.json()
-        assert data["detail"] == "Participant not found in this activity"
+        with pytest.raises(HTTPException) as exc:
+            remove_participant("Chess Club", "notregistered@mergington.edu")
+        assert exc.value.status_code == 404
+        assert exc.value.detail == "Participant not found in this activity"
+
+
+class TestUrlEncodedEndpoints:
+    """Tests for endpoints addressed with URL-encoded path segments"""
     
-    def test_remove_participant_with_url_encoding(self, client):
-        """Test removing participant with URL-encoded names"""
-        response = client.delete(
-            "/activities/Track%20and%20Field/participants/ava%40mergington.edu"
-        )
-        assert response.status_code == 200
+    @pytest.mark.parametrize("method,url,expected", [
+        ("POST", _SIGNUP_URL(activity="Track%20and%20Field", email="newrunner@mergington.edu"), 200),
+        ("DELETE", _REMOVE_URL(activity="Track%20and%20Field", email="ava%40mergington.edu"), 200),
+    ])
+    def test_url_encoded_endpoints(self, client, method, url, expected):
+        """Test that URL-encoded activity names and emails are decoded"""
+        response = client.request(method, url)
+        assert response.status_code == expected
 
 
 class TestIntegrationScenarios:
@@ -219,23 +237,21 @@ class TestIntegrationScenarios:
         activity = "Chess Club"
         
         # Get initial participant count
-        initial_activities = client.get("/activities").json()
-        initial_count = len(initial_activities[activity]["participants"])
+        initial_count = len(activities[activity]["participants"])
         
         # Sign up
-        signup_response = client.post(f"/activities/{activity}/signup?email={email}")
+        signup_response = client.post(_SIGNUP_URL(activity=activity, email=email))
         assert signup_response.status_code == 200
         
         # Verify signup
-        after_signup = client.get("/activities").json()
-        assert email in after_signup[activity]["participants"]
-        assert len(after_signup[activity]["participants"]) == initial_count + 1
+        assert email in activities[activity]["participants"]
+        assert len(activities[activity]["participants"]) == initial_count + 1
         
         # Remove participant
-        remove_response = client.delete(f"/activities/{activity}/participants/{email}")
+        remove_response = client.delete(_REMOVE_URL(activity=activity, email=email))
         assert remove_response.status_code == 200
         
-        # Verify removal
+        # Verify removal end to end through the API
         after_removal = client.get("/activities").json()
         assert email not in after_removal[activity]["participants"]
         assert len(after_removal[activity]["participants"]) == initial_count
@@ -243,14 +259,12 @@ class TestIntegrationScenarios:
     def test_multiple_signups_different_activities(self, client):
         """Test that a student can sign up for multiple activities"""
         email = "multisport@mergington.edu"
+        chosen = ("Chess Club", "Programming Class", "Art Club")
         
         # Sign up for multiple activities
-        client.post(f"/activities/Chess Club/signup?email={email}")
-        client.post(f"/activities/Programming Class/signup?email={email}")
-        client.post(f"/activities/Art Club/signup?email={email}")
+        for activity in chosen:
+            assert client.post(_SIGNUP_URL(activity=activity, email=email)).status_code == 200
         
         # Verify presence in all activities
-        activities_data = client.get("/activities").json()
-        assert email in activities_data["Chess Club"]["participants"]
-        assert email in activities_data["Programming Class"]["participants"]
-        assert email in activities_data["Art Club"]["participants"]
+        for activity in chosen:
+            assert email in activities[activity]["participants"]